@@ -21,6 +21,8 @@ import requests
 from dotenv import load_dotenv
 import os
 
+from static_assets import init_static
+
 load_dotenv()
 
 # ============================================
@@ -625,6 +627,16 @@ def health_check():
         'timestamp': datetime.utcnow().isoformat()
     }), 200
 
+# ============================================
+# Static Frontend (optional)
+# ============================================
+
+# SERVE_FRONTEND=True serves frontend/ from this server with hashed,
+# precompressed and cacheable assets (see static_assets.py)
+if os.getenv('SERVE_FRONTEND', 'False').lower() in ('true', '1', 'yes'):
+    app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'False').lower() in ('true', '1', 'yes')
+    init_static(app)
+
 # ============================================
 # Error Handlers
 # ============================================
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# ============================================
+# FILE: backend/bench_static.py
+# Location: mindcare/backend/bench_static.py
+# Benchmark: plain vs precompressed/cached frontend serving
+# ============================================
+#
+# Starts two local servers over the frontend/ folder and loads every page
+# plus the stylesheets it links, reporting bytes on the wire (body +
+# headers), requests and request/response time per page load:
+#   - plain:      send_from_directory, no compression, no long-lived caching
+#   - optimized:  static_assets.init_static (gzip/brotli, hashed URLs, ETags)
+#
+# Usage:
+#   python bench_static.py [--rounds 50]
+
+import argparse
+import gzip
+import http.client
+import re
+import tempfile
+import threading
+import time
+
+from flask import Flask, send_from_directory
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from static_assets import DEFAULT_FRONTEND_DIR, brotli, init_static
+
+# Local stylesheets only; Google Fonts etc. are the same in both modes
+STYLESHEET_RE = re.compile(r'<link rel="stylesheet" href="([^"#?:]+)"')
+
+
+def plain_app():
+    app = Flask(__name__)
+
+    @app.route('/<path:filename>')
+    def frontend_file(filename):
+        return send_from_directory(DEFAULT_FRONTEND_DIR, filename)
+
+    return app
+
+
+def optimized_app(cache_dir):
+    app = Flask(__name__)
+    manifest = init_static(app, DEFAULT_FRONTEND_DIR, cache_dir)
+    return app, manifest
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+def start(app):
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def fetch(conn, path, headers):
+    """Returns (status, bytes on the wire, seconds, decoded body, response)"""
+    started = time.perf_counter()
+    conn.request('GET', path, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    elapsed = time.perf_counter() - started
+    wire_bytes = len(body) + sum(len(k) + len(v) + 4 for k, v in response.getheaders())
+    encoding = response.getheader('Content-Encoding')
+    if encoding == 'gzip':
+        body = gzip.decompress(body)
+    elif encoding == 'br':
+        body = brotli.decompress(body)
+    return response.status, wire_bytes, elapsed, body, response
+
+
+def page_load(conn, page, headers, cache):
+    """Fetch a page and the stylesheets it links, honouring a tiny browser cache.
+
+    cache maps path -> (etag, expiry, body); it is filled in as we go so a
+    second call with the same cache simulates a repeat visit.
+    """
+    total_bytes, requests_made, total_time = 0, 0, 0.0
+    now = time.time()
+
+    def get(path):
+        nonlocal total_bytes, requests_made, total_time
+        cached = cache.get(path)
+        if cached and cached[1] > now:
+            return cached[2]
+        req_headers = dict(headers)
+        if cached and cached[0]:
+            req_headers['If-None-Match'] = cached[0]
+        status, size, elapsed, body, response = fetch(conn, path, req_headers)
+        total_bytes += size
+        requests_made += 1
+        total_time += elapsed
+        if status == 304:
+            return cached[2]
+        match = re.search(r'max-age=(\d+)', response.getheader('Cache-Control') or '')
+        expiry = now + int(match.group(1)) if match else 0
+        cache[path] = (response.getheader('ETag'), expiry, body)
+        return body
+
+    html = get(page).decode('utf-8', 'replace')
+    for href in STYLESHEET_RE.findall(html):
+        get(href if href.startswith('/') else '/' + href)
+    return total_bytes, requests_made, total_time
+
+
+def run(server, pages, headers, rounds, repeat_visit):
+    conn = http.client.HTTPConnection('127.0.0.1', server.server_port)
+    total_bytes, total_requests, total_time = 0, 0, 0.0
+    for _ in range(rounds):
+        for page in pages:
+            cache = {}
+            if repeat_visit:
+                page_load(conn, page, headers, cache)
+            size, count, elapsed = page_load(conn, page, headers, cache)
+            total_bytes += size
+            total_requests += count
+            total_time += elapsed
+    conn.close()
+    loads = rounds * len(pages)
+    return total_bytes / loads, total_requests / loads, total_time * 1000 / loads
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare plain vs optimized frontend serving')
+    parser.add_argument('--rounds', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        plain = start(plain_app())
+        app, manifest = optimized_app(cache_dir)
+        optimized = start(app)
+        pages = sorted(p for p in manifest if p.endswith('.html'))
+
+        scenarios = [
+            ('plain (identity)', plain, {'Accept-Encoding': 'identity'}, False),
+            ('plain (repeat visit)', plain, {'Accept-Encoding': 'identity'}, True),
+            ('optimized gzip', optimized, {'Accept-Encoding': 'gzip'}, False),
+        ]
+        if brotli is not None:
+            scenarios.append(('optimized br', optimized, {'Accept-Encoding': 'br, gzip'}, False))
+        scenarios.append(('optimized (repeat visit)', optimized, {'Accept-Encoding': 'br, gzip'}, True))
+
+        print(f"Pages: {len(pages)}  Rounds: {args.rounds}  Brotli: {'yes' if brotli else 'no'}")
+        print(f"{'scenario':<28}{'bytes/load':>12}{'reqs/load':>11}{'ms/load':>10}")
+        baseline = None
+        for name, server, headers, repeat_visit in scenarios:
+            size, count, ms = run(server, pages, headers, args.rounds, repeat_visit)
+            baseline = baseline or size
+            print(f"{name:<28}{size:>12.0f}{count:>11.1f}{ms:>10.2f}  ({size / baseline:.0%} of plain)")
+
+        plain.shutdown()
+        optimized.shutdown()
+
+
+if __name__ == '__main__':
+    main()
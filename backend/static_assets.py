@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# ============================================
+# FILE: backend/static_assets.py
+# Location: mindcare/backend/static_assets.py
+# Optional static serving of the frontend/ folder
+# ============================================
+#
+# Assets are copied into a cache folder under content-hashed names and
+# precompressed once (gzip, plus brotli when the `brotli` package is
+# installed). HTML pages are rewritten to point at the hashed URLs, so
+# CSS/JS can be cached forever while pages are always revalidated.
+#
+# Build ahead of time (optional, start-up does the same thing):
+#   python static_assets.py
+
+import copy
+import gzip
+import hashlib
+import mimetypes
+import os
+import posixpath
+import re
+import time
+from datetime import datetime, timezone
+
+from flask import abort, request, send_file
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FRONTEND_DIR = os.path.join(os.path.dirname(BACKEND_DIR), 'frontend')
+DEFAULT_CACHE_DIR = os.path.join(BACKEND_DIR, '.static_cache')
+
+# Flask already owns /static, so hashed assets live under /assets
+ASSET_PREFIX = '/assets/'
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_COMPRESS_SIZE = 256
+
+# Pruning keeps every file used by the last few builds, so a server started
+# from an older build keeps working after `python static_assets.py`, and
+# never touches files young enough to belong to a build still in progress
+KEEP_BUILDS = 3
+PRUNE_GRACE_SECONDS = 10 * 60
+
+# href="css/style.css" / src="js/app.js" (external and templated URLs are skipped)
+LOCAL_REF_RE = re.compile(r'(\b(?:href|src)=")([^"#?:${}]+)(")')
+
+
+class StaticAsset:
+    """One servable file and its precompressed variants"""
+
+    def __init__(self, path, mimetype, digest, mtime, cacheable):
+        self.path = path
+        self.mimetype = mimetype
+        self.digest = digest
+        self.last_modified = datetime.fromtimestamp(mtime, tz=timezone.utc)
+        self.max_age = IMMUTABLE_MAX_AGE if cacheable else 0
+        self.immutable = cacheable
+        # encoding name -> file path, only for variants that are actually smaller
+        self.encodings = {}
+
+
+# ============================================
+# Build
+# ============================================
+
+def _hashed_name(rel_path, digest):
+    root, ext = posixpath.splitext(rel_path)
+    return f"{root}.{digest}{ext}"
+
+
+def _is_compressible(mimetype):
+    return mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+def _write_once(path, data):
+    """Cache names carry the content hash, so an existing file is already up to date"""
+    if os.path.exists(path):
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _precompress(asset, data):
+    if not _is_compressible(asset.mimetype) or len(data) < MIN_COMPRESS_SIZE:
+        return
+
+    variants = [('gzip', '.gz', lambda d: gzip.compress(d, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.insert(0, ('br', '.br', lambda d: brotli.compress(d, quality=11)))
+
+    for encoding, suffix, compress in variants:
+        out_path = asset.path + suffix
+        if not os.path.exists(out_path):
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                continue
+            _write_once(out_path, compressed)
+        if os.path.getsize(out_path) < len(data):
+            asset.encodings[encoding] = out_path
+
+
+def _build_asset(cache_dir, rel_path, data, mimetype, mtime, cacheable):
+    """Copy data into the cache under a content-hashed name and precompress it"""
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    path = os.path.join(cache_dir, *_hashed_name(rel_path, digest).split('/'))
+    _write_once(path, data)
+
+    asset = StaticAsset(path, mimetype, digest, mtime, cacheable)
+    _precompress(asset, data)
+    return asset
+
+
+def _rewrite_html(html, page_dir, hashed_urls):
+    def replace(match):
+        ref = posixpath.normpath(posixpath.join(page_dir, match.group(2)))
+        if ref in hashed_urls:
+            return match.group(1) + hashed_urls[ref] + match.group(3)
+        return match.group(0)
+
+    return LOCAL_REF_RE.sub(replace, html)
+
+
+def build_manifest(frontend_dir=DEFAULT_FRONTEND_DIR, cache_dir=DEFAULT_CACHE_DIR):
+    """Hash, rewrite and precompress everything in frontend_dir.
+
+    Returns a dict mapping URL path -> StaticAsset.
+    """
+    pages, assets = [], []
+    for root, _, files in os.walk(frontend_dir):
+        for name in sorted(files):
+            full_path = os.path.join(root, name)
+            rel_path = os.path.relpath(full_path, frontend_dir).replace(os.sep, '/')
+            (pages if name.endswith('.html') else assets).append((rel_path, full_path))
+
+    manifest = {}
+    hashed_urls = {}
+    newest_asset_mtime = 0
+
+    # Assets first so pages can be rewritten to their hashed URLs
+    for rel_path, full_path in assets:
+        with open(full_path, 'rb') as f:
+            data = f.read()
+        mimetype = mimetypes.guess_type(rel_path)[0] or 'application/octet-stream'
+        mtime = os.path.getmtime(full_path)
+        newest_asset_mtime = max(newest_asset_mtime, mtime)
+
+        asset = _build_asset(cache_dir, 'assets/' + rel_path, data, mimetype, mtime, cacheable=True)
+        hashed_url = ASSET_PREFIX + _hashed_name(rel_path, asset.digest)
+        manifest[hashed_url] = asset
+        # Unhashed name still works (e.g. url() inside CSS), but is revalidated
+        manifest[ASSET_PREFIX + rel_path] = _revalidated(asset)
+        hashed_urls[rel_path] = hashed_url
+
+    for rel_path, full_path in pages:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            html = f.read()
+        html = _rewrite_html(html, posixpath.dirname(rel_path), hashed_urls)
+        # A page changes whenever an asset it links to gets a new hash
+        mtime = max(os.path.getmtime(full_path), newest_asset_mtime)
+
+        manifest['/' + rel_path] = _build_asset(cache_dir, 'pages/' + rel_path, html.encode('utf-8'),
+                                                'text/html', mtime, cacheable=False)
+
+    if '/index.html' in manifest:
+        manifest['/'] = manifest['/index.html']
+
+    _record_build(cache_dir, manifest)
+    _prune_cache(cache_dir)
+    return manifest
+
+
+def _record_build(cache_dir, manifest):
+    """Write builds/<digest>.txt listing the cache files this build uses"""
+    live = set()
+    for asset in manifest.values():
+        live.add(os.path.relpath(asset.path, cache_dir))
+        live.update(os.path.relpath(p, cache_dir) for p in asset.encodings.values())
+
+    listing = '\n'.join(sorted(live)).encode('utf-8')
+    record = os.path.join(cache_dir, 'builds', hashlib.sha256(listing).hexdigest()[:12] + '.txt')
+    _write_once(record, listing)
+    # Identical builds (e.g. several workers starting together) share a record
+    os.utime(record)
+
+
+def _prune_cache(cache_dir):
+    """Delete cache files that none of the last KEEP_BUILDS builds use"""
+    builds_dir = os.path.join(cache_dir, 'builds')
+    records = []
+    for name in os.listdir(builds_dir):
+        path = os.path.join(builds_dir, name)
+        if name.endswith('.txt'):
+            try:
+                records.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                pass
+    records.sort(reverse=True)
+
+    keep = set()
+    for _, path in records[:KEEP_BUILDS]:
+        with open(path, 'r', encoding='utf-8') as f:
+            keep.update(os.path.join(cache_dir, line) for line in f.read().splitlines())
+    stale = [path for _, path in records[KEEP_BUILDS:]]
+
+    for subdir in ('assets', 'pages'):
+        for root, _, files in os.walk(os.path.join(cache_dir, subdir)):
+            stale.extend(os.path.join(root, name) for name in files
+                         if os.path.join(root, name) not in keep)
+
+    # Directories are left in place: another process may be about to write there
+    cutoff = time.time() - PRUNE_GRACE_SECONDS
+    for path in stale:
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _revalidated(asset):
+    view = copy.copy(asset)
+    view.max_age = 0
+    view.immutable = False
+    return view
+
+
+# ============================================
+# Serving
+# ============================================
+
+def negotiate_encoding(asset, accept_encodings):
+    """Pick the best precompressed variant the client accepts (None = identity)"""
+    best, best_quality = None, 0
+    # Prefer brotli over gzip when the client rates them equally
+    for encoding in ('br', 'gzip'):
+        if encoding not in asset.encodings:
+            continue
+        quality = accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def serve_asset(asset):
+    encoding = negotiate_encoding(asset, request.accept_encodings)
+    path = asset.encodings[encoding] if encoding else asset.path
+    etag = f"{asset.digest}-{encoding}" if encoding else asset.digest
+
+    # Passing a path (not bytes) lets the WSGI server use sendfile(), or
+    # X-Sendfile when USE_X_SENDFILE is set behind nginx/Apache.
+    try:
+        response = send_file(
+            path,
+            mimetype=asset.mimetype,
+            conditional=False,
+            etag=etag,
+            last_modified=asset.last_modified,
+            max_age=asset.max_age,
+        )
+    except FileNotFoundError:
+        # Pruned by a newer build; the client should reload the page
+        abort(404)
+    # Ranges only make sense on the identity bytes; slicing a gzip/br
+    # stream would hand resuming clients a corrupt body
+    try:
+        response.make_conditional(
+            request.environ, accept_ranges=encoding is None, complete_length=response.content_length
+        )
+    except RequestedRangeNotSatisfiable:
+        response.close()
+        raise
+    if response.status_code == 304:
+        response.headers.pop('X-Sendfile', None)
+    # send_file names the cache file here (e.g. style.<hash>.css.gz)
+    response.headers.pop('Content-Disposition', None)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if asset.encodings:
+        response.vary.add('Accept-Encoding')
+    if asset.immutable:
+        response.cache_control.immutable = True
+    return response
+
+
+def init_static(app, frontend_dir=DEFAULT_FRONTEND_DIR, cache_dir=DEFAULT_CACHE_DIR):
+    """Register routes that serve the frontend pages and hashed assets"""
+    manifest = build_manifest(frontend_dir, cache_dir)
+    app.extensions['static_manifest'] = manifest
+
+    def frontend_file(url):
+        return serve_asset(manifest[url])
+
+    # One rule per file (no catch-all), so unknown API paths keep their
+    # normal 404/405 handling
+    for url in manifest:
+        app.add_url_rule(url, 'frontend_file', frontend_file, defaults={'url': url}, methods=['GET'])
+    return manifest
+
+
+if __name__ == '__main__':
+    built = build_manifest()
+    encodings = 'brotli + gzip' if brotli is not None else 'gzip (install brotli for .br)'
+    print(f"✅ Built {len(built)} static routes into {DEFAULT_CACHE_DIR}")
+    print(f"✅ Precompressed with {encodings}")
@@ -0,0 +1,158 @@
+# ============================================
+# FILE: backend/test_static_assets.py
+# Location: mindcare/backend/test_static_assets.py
+# Tests for static_assets.py (run: python -m pytest -q)
+# ============================================
+
+import os
+import re
+
+import pytest
+from flask import Flask
+
+import static_assets
+from static_assets import build_manifest, init_static
+
+STYLE_CSS = 'body { margin: 0; padding: 0; font-family: sans-serif; }\n' * 20
+INDEX_HTML = (
+    '<!DOCTYPE html>\n<html>\n<head>\n'
+    '    <link rel="stylesheet" href="css/style.css">\n'
+    '    <link href="https://fonts.googleapis.com/css2?family=Inter" rel="stylesheet">\n'
+    '</head>\n<body>\n' + '    <p>MindCare</p>\n' * 30 + '</body>\n</html>\n'
+)
+
+
+@pytest.fixture
+def frontend_dir(tmp_path):
+    frontend_dir = tmp_path / 'frontend'
+    (frontend_dir / 'css').mkdir(parents=True)
+    (frontend_dir / 'css' / 'style.css').write_text(STYLE_CSS)
+    (frontend_dir / 'index.html').write_text(INDEX_HTML)
+    return frontend_dir
+
+
+@pytest.fixture
+def client(tmp_path, frontend_dir):
+    app = Flask(__name__)
+    init_static(app, str(frontend_dir), str(tmp_path / 'cache'))
+    return app.test_client()
+
+
+def hashed_css_url(client):
+    html = client.get('/index.html').get_data(as_text=True)
+    return re.search(r'href="(/assets/css/style\.[0-9a-f]{12}\.css)"', html).group(1)
+
+
+def test_html_links_rewritten_to_hashed_assets(client):
+    html = client.get('/index.html').get_data(as_text=True)
+    assert re.search(r'href="/assets/css/style\.[0-9a-f]{12}\.css"', html)
+    assert 'href="https://fonts.googleapis.com/css2?family=Inter"' in html
+
+
+def test_gzip_vs_identity(client):
+    url = hashed_css_url(client)
+
+    gzipped = client.get(url, headers={'Accept-Encoding': 'gzip'})
+    assert gzipped.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in gzipped.headers['Vary']
+
+    plain = client.get(url, headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in plain.headers
+    assert plain.get_data(as_text=True) == STYLE_CSS
+    assert len(gzipped.get_data()) < len(plain.get_data())
+
+
+def test_if_none_match_uses_per_encoding_etag(client):
+    url = hashed_css_url(client)
+    gzip_etag = client.get(url, headers={'Accept-Encoding': 'gzip'}).headers['ETag']
+    identity_etag = client.get(url, headers={'Accept-Encoding': 'identity'}).headers['ETag']
+    assert gzip_etag != identity_etag
+
+    cached = client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': gzip_etag})
+    assert cached.status_code == 304
+
+    # A gzip ETag must not validate the identity body
+    other = client.get(url, headers={'Accept-Encoding': 'identity', 'If-None-Match': gzip_etag})
+    assert other.status_code == 200
+
+
+def test_cache_control(client):
+    asset = client.get(hashed_css_url(client))
+    assert asset.cache_control.immutable
+    assert asset.cache_control.max_age == 365 * 24 * 60 * 60
+
+    for url in ('/', '/index.html', '/assets/css/style.css'):
+        response = client.get(url)
+        assert response.cache_control.no_cache
+        assert not response.cache_control.immutable
+
+
+def test_range_ignored_on_compressed_variant(client):
+    url = hashed_css_url(client)
+    gzipped = client.get(url, headers={'Accept-Encoding': 'gzip', 'Range': 'bytes=0-10'})
+    assert gzipped.status_code == 200
+
+    plain = client.get(url, headers={'Accept-Encoding': 'identity', 'Range': 'bytes=0-10'})
+    assert plain.status_code == 206
+    assert plain.get_data(as_text=True) == STYLE_CSS[:11]
+
+
+def test_unknown_and_traversal_paths_404(client):
+    assert client.get('/../backend/app.py').status_code == 404
+    assert client.get('/assets/../../backend/app.py').status_code == 404
+    assert client.get('/missing.html').status_code == 404
+
+
+def cache_files(manifest):
+    files = set()
+    for asset in manifest.values():
+        files.add(asset.path)
+        files.update(asset.encodings.values())
+    return files
+
+
+def test_prune_removes_builds_older_than_keep_builds(tmp_path, frontend_dir, monkeypatch):
+    monkeypatch.setattr(static_assets, 'PRUNE_GRACE_SECONDS', 0)
+    cache_dir = str(tmp_path / 'cache')
+
+    first = cache_files(build_manifest(str(frontend_dir), cache_dir))
+    for i in range(static_assets.KEEP_BUILDS):
+        (frontend_dir / 'css' / 'style.css').write_text(STYLE_CSS + f'/* edit {i} */\n')
+        latest = cache_files(build_manifest(str(frontend_dir), cache_dir))
+
+    stale = first - latest
+    assert stale and not any(os.path.exists(path) for path in stale)
+    assert all(os.path.exists(path) for path in latest)
+
+
+def test_rebuild_keeps_files_of_a_running_server(tmp_path, frontend_dir, monkeypatch):
+    monkeypatch.setattr(static_assets, 'PRUNE_GRACE_SECONDS', 0)
+    cache_dir = str(tmp_path / 'cache')
+    app = Flask(__name__)
+    init_static(app, str(frontend_dir), cache_dir)
+    client = app.test_client()
+    old_css_url = hashed_css_url(client)
+
+    # `python static_assets.py` after a CSS edit, while the server is running
+    (frontend_dir / 'css' / 'style.css').write_text(STYLE_CSS + '/* edit */\n')
+    build_manifest(str(frontend_dir), cache_dir)
+
+    assert client.get('/index.html', headers={'Accept-Encoding': 'gzip'}).status_code == 200
+    assert client.get(old_css_url, headers={'Accept-Encoding': 'gzip'}).status_code == 200
+
+    # Once enough newer builds push it out, the old server answers 404, not 500
+    for i in range(static_assets.KEEP_BUILDS):
+        (frontend_dir / 'css' / 'style.css').write_text(STYLE_CSS + f'/* edit {i} */\n')
+        build_manifest(str(frontend_dir), cache_dir)
+    assert client.get(old_css_url, headers={'Accept-Encoding': 'gzip'}).status_code == 404
+
+
+def test_prune_skips_recent_files(tmp_path, frontend_dir):
+    cache_dir = tmp_path / 'cache'
+    build_manifest(str(frontend_dir), str(cache_dir))
+
+    # Another worker's in-flight write
+    in_flight = cache_dir / 'assets' / 'css' / 'style.css.99999.tmp'
+    in_flight.write_text('partial')
+    build_manifest(str(frontend_dir), str(cache_dir))
+    assert in_flight.exists()